@@ -1,28 +1,45 @@
 import json
-from dataclasses import asdict, dataclass
+import os
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Final, Sized
+from typing import Annotated, Final, Self, Sized
 
 import typer
-from typing_extensions import Annotated
 
-DB_FILE = Path("journal.json")
-DB_FILE.touch(exist_ok=True)
+try:
+    from orjson import dumps as _dumps
+    from orjson import loads as _loads
+except ImportError:  # orjson is an optional speedup, fall back to the stdlib
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+DB_FILE = Path("journal.jsonl")
+LEGACY_DB_FILE = Path("journal.json")
 DASH_LENTGH: Final[int] = 80
+LINE_SEP: Final[str] = "-" * DASH_LENTGH
 MAX_TITLE_LENGHT: Final[int] = 50
 MAX_CONTENT_LENGHT: Final[int] = 200
+MMAP_MIN_SIZE: Final[int] = 4 * 1024
+ENTRY_FIELDS: Final[frozenset[str]] = frozenset({"title", "content", "tags", "date"})
+
+_now = datetime.now
 
 app = typer.Typer()
 
 
 # 📝 Define a JournalEntry class with title, content, and date
-@dataclass
+@dataclass(slots=True)
 class JournalEntry:
     title: str
     content: str
     tags: str | None
-    date: datetime
+    date: str = field(default_factory=lambda: _now().isoformat(timespec="seconds"))
 
     def __post_init__(self):
         if len(self.title) > MAX_TITLE_LENGHT:
@@ -30,6 +47,23 @@ class JournalEntry:
         if len(self.content) > MAX_CONTENT_LENGHT:
             raise ValueError(f"Content cannot exceed {MAX_CONTENT_LENGHT} characters.")
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, str | None]) -> Self:
+        """Build an entry from already validated stored data, skipping __post_init__."""
+        entry = object.__new__(cls)
+        for name, value in data.items():
+            object.__setattr__(entry, name, value)
+        return entry
+
+    def to_dict(self) -> dict[str, str | None]:
+        """Return the entry as a plain dict, without asdict's recursive deepcopy."""
+        return {
+            "title": self.title,
+            "content": self.content,
+            "tags": self.tags,
+            "date": self.date,
+        }
+
     @property
     def summary(self) -> str:
         """Return a formatted string representation of the journal entry."""
@@ -37,40 +71,126 @@ class JournalEntry:
         title = self.title.upper()
         content = self.content
         tags = self.tags if self.tags != "" else "No tags"
-        return f"{'-'*DASH_LENTGH}\n📝 {title}. -- 📅 {date}\nTags: {tags}\n{'-'*DASH_LENTGH}\n{content}"
+        return (
+            f"{LINE_SEP}\n📝 {title}. -- 📅 {date}\nTags: {tags}\n{LINE_SEP}\n{content}"
+        )
 
 
 def load_entries() -> Sized[JournalEntry]:
-    """Load journal entries from the JSON file."""
-    with DB_FILE.open("r", encoding="utf-8") as f:
+    """Load journal entries from the JSONL file."""
+    try:
+        size = DB_FILE.stat().st_size
+    except FileNotFoundError:
+        return []
+    if size < MMAP_MIN_SIZE:
+        entries = _parse_lines(DB_FILE.read_bytes().splitlines())
+    else:
+        import mmap
+
+        # Read lines straight from the page cache instead of copying the file.
+        with (
+            DB_FILE.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            entries = _parse_lines(iter(mm.readline, b""))
+    return entries
+
+
+def _is_record(data: object) -> bool:
+    """Return whether decoded JSON holds exactly the fields of a journal entry."""
+    return isinstance(data, dict) and data.keys() == ENTRY_FIELDS
+
+
+def _parse_lines(lines: Iterable[bytes]) -> list[JournalEntry]:
+    """Build journal entries from JSONL lines, skipping blank and unreadable ones."""
+    entries = []
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
         try:
-            data = json.load(f)
-            return [JournalEntry(**entry) for entry in data]
-        except json.JSONDecodeError:
-            return []
+            data = _loads(line)
+        except ValueError:
+            # Typically a partial last line left by an interrupted append; the
+            # stdlib fallback raises UnicodeDecodeError if it splits a character.
+            data = None
+        if _is_record(data):
+            entries.append(JournalEntry.from_trusted(data))
+        else:
+            typer.echo(f"⚠️ Skipping unreadable line {number} of {DB_FILE}.", err=True)
+    return entries
+
+
+def _serialize(entries: Iterable[JournalEntry]) -> bytes:
+    """Serialize journal entries as JSONL, one entry per line."""
+    return b"".join(_dumps(entry.to_dict()) + b"\n" for entry in entries)
 
 
 def save_entries(entries: Sized[JournalEntry]) -> None:
-    """Save journal entries to the JSON file."""
-    with DB_FILE.open("w", encoding="utf-8") as f:
-        json.dump([asdict(entry) for entry in entries], f, indent=4)
+    """Atomically rewrite the JSONL file so a crash never leaves it half written."""
+    tmp_file = DB_FILE.with_suffix(f"{DB_FILE.suffix}.tmp")
+    try:
+        with tmp_file.open("wb") as f:
+            f.write(_serialize(entries))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, DB_FILE)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def add_entries(entries: Sized[JournalEntry]) -> None:
+    """Append journal entries to the JSONL file in a single write."""
+    data = _serialize(entries)
+    # Appends are not fsynced: a torn write can only damage the appended lines,
+    # which load_entries skips, and the next append starts on a fresh line.
+    with DB_FILE.open("a+b") as f:
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                # Never glue new entries onto a partial line.
+                data = b"\n" + data
+        f.write(data)
 
 
 def add_entry(title: str, content: str, tags: str | None = "") -> None:
-    """Create a new journal entry and save it to the JSON file."""
-    entries = load_entries()
-    journal_entry = JournalEntry(
-        title=title, content=content, date=datetime.now().isoformat(), tags=tags
-    )
-    entries.append(journal_entry)
-    save_entries(entries)
+    """Create a new journal entry and append it to the JSONL file."""
+    add_entries([JournalEntry(title=title, content=content, tags=tags)])
+
+
+def _migrate_legacy_file() -> None:
+    """Move entries from the old journal.json into an empty journal.jsonl."""
+    if not LEGACY_DB_FILE.exists():
+        return
+    if DB_FILE.exists() and DB_FILE.stat().st_size:
+        typer.echo(
+            f"⚠️ {LEGACY_DB_FILE} was not migrated because {DB_FILE} has entries.",
+            err=True,
+        )
+        return
+    data = LEGACY_DB_FILE.read_bytes()
+    try:
+        if data.lstrip().startswith(b"["):
+            # Journals written before the JSONL switch hold a single JSON array.
+            records = _loads(data)
+        else:
+            records = [_loads(line) for line in data.splitlines() if line.strip()]
+    except ValueError:
+        records = None
+    if records is None or not all(_is_record(record) for record in records):
+        typer.echo(
+            f"⚠️ {LEGACY_DB_FILE} was not migrated because it is not a valid journal.",
+            err=True,
+        )
+        return
+    save_entries([JournalEntry.from_trusted(record) for record in records])
+    LEGACY_DB_FILE.unlink()
 
 
 def list_entries(entries: Sized[JournalEntry]) -> None:
-    """Print all journal entries to the console."""
-    for entry in entries:
-        print(entry.summary)
-    print(f"{'-'*DASH_LENTGH}\nTotal entries: {len(entries)}")
+    """Print all journal entries to the console in a single write."""
+    body = "".join(f"{entry.summary}\n" for entry in entries)
+    sys.stdout.write(f"{body}{LINE_SEP}\nTotal entries: {len(entries)}\n")
 
 
 @app.command()
@@ -105,14 +225,18 @@ def populate() -> None:
     """Populate the journal with predefined entries."""
     from populate_dev_journal import CONTENTS, TAGS, TITLES
 
+    entries = []
     for title, content, tags in zip(TITLES, CONTENTS, TAGS):
         try:
-            add_entry(title, content, tags)
+            entries.append(JournalEntry(title=title, content=content, tags=tags))
         except ValueError as e:
             typer.echo(f"❌ Failed to add journal entry '{title}'. Reason: {e}")
-        else:
-            typer.echo(f"🔥 Journal entry '{title}' saved.")
+    if entries:
+        add_entries(entries)
+    for entry in entries:
+        typer.echo(f"🔥 Journal entry '{entry.title}' saved.")
 
 
 if __name__ == "__main__":
+    _migrate_legacy_file()
     app()
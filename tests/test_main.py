@@ -0,0 +1,200 @@
+import json
+
+import pytest
+
+import main
+import populate_dev_journal
+
+ENTRY = b'{"title":"ok","content":"fine","tags":"","date":"2025-11-30T10:00:00"}\n'
+
+
+@pytest.fixture
+def db_file(tmp_path, monkeypatch):
+    db_file = tmp_path / "journal.jsonl"
+    monkeypatch.setattr(main, "DB_FILE", db_file)
+    monkeypatch.setattr(main, "LEGACY_DB_FILE", tmp_path / "journal.json")
+    return db_file
+
+
+def test_partial_last_line_keeps_other_entries(db_file, capsys):
+    db_file.write_bytes(ENTRY + b'{"title":"ha')
+
+    entries = main.load_entries()
+
+    assert [entry.title for entry in entries] == ["ok"]
+    assert "Skipping unreadable line 2" in capsys.readouterr().err
+
+
+def test_add_after_partial_line_starts_a_new_line(db_file):
+    db_file.write_bytes(ENTRY + b'{"title":"ha')
+
+    main.add_entry("next", "entry")
+
+    assert [entry.title for entry in main.load_entries()] == ["ok", "next"]
+    assert db_file.read_bytes().splitlines()[1] == b'{"title":"ha'
+
+
+def test_migrate_baseline_array_file(db_file):
+    legacy = main.LEGACY_DB_FILE
+    legacy.write_text(
+        """[
+    {
+        "title": "first",
+        "content": "one",
+        "tags": "a, b",
+        "date": "2025-11-30T10:00:00.000001"
+    },
+    {
+        "title": "second",
+        "content": "two",
+        "tags": "",
+        "date": "2025-11-30T11:00:00.000002"
+    }
+]""",
+        encoding="utf-8",
+    )
+
+    main._migrate_legacy_file()
+
+    assert not legacy.exists()
+    assert len(db_file.read_bytes().splitlines()) == 2
+    entries = main.load_entries()
+    assert [entry.title for entry in entries] == ["first", "second"]
+    assert entries[0].tags == "a, b"
+    assert entries[1].date == "2025-11-30T11:00:00.000002"
+
+
+def test_migrate_empty_file(db_file):
+    main.LEGACY_DB_FILE.touch()
+
+    main._migrate_legacy_file()
+
+    assert not main.LEGACY_DB_FILE.exists()
+    assert main.load_entries() == []
+
+
+def test_migrate_jsonl_file(db_file):
+    main.LEGACY_DB_FILE.write_bytes(ENTRY + ENTRY.replace(b'"ok"', b'"two"'))
+
+    main._migrate_legacy_file()
+
+    assert not main.LEGACY_DB_FILE.exists()
+    assert [entry.title for entry in main.load_entries()] == ["ok", "two"]
+
+
+def test_migrate_keeps_legacy_file_when_journal_has_entries(db_file, capsys):
+    db_file.write_bytes(ENTRY)
+    main.LEGACY_DB_FILE.write_text("[]", encoding="utf-8")
+
+    main._migrate_legacy_file()
+
+    assert main.LEGACY_DB_FILE.read_text(encoding="utf-8") == "[]"
+    assert db_file.read_bytes() == ENTRY
+    assert "was not migrated" in capsys.readouterr().err
+
+
+def test_migrate_keeps_invalid_legacy_file(db_file, capsys):
+    main.LEGACY_DB_FILE.write_text('[{"title": "broken"', encoding="utf-8")
+
+    main._migrate_legacy_file()
+
+    assert main.LEGACY_DB_FILE.read_text(encoding="utf-8") == '[{"title": "broken"'
+    assert not db_file.exists()
+    assert "not a valid journal" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "legacy",
+    [b"[1, 2]", b'[{"title": "x"}]', ENTRY + b"[]\n", b'[{"title": "caf\xe9"}]'],
+    ids=["not-objects", "missing-keys", "jsonl-not-objects", "invalid-utf8"],
+)
+@pytest.mark.parametrize("loads", [main._loads, json.loads], ids=["default", "stdlib"])
+def test_migrate_keeps_legacy_file_that_is_not_a_journal(
+    db_file, monkeypatch, capsys, legacy, loads
+):
+    monkeypatch.setattr(main, "_loads", loads)
+    main.LEGACY_DB_FILE.write_bytes(legacy)
+
+    main._migrate_legacy_file()
+
+    assert main.LEGACY_DB_FILE.read_bytes() == legacy
+    assert not db_file.exists()
+    assert "not a valid journal" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("loads", [main._loads, json.loads], ids=["default", "stdlib"])
+@pytest.mark.parametrize(
+    "bad_line",
+    [
+        b'{"title":"\xf0\x9f',
+        b"[]",
+        b'{"id":"1","title":"x","content":"y","tags":"","date":"d"}',
+        b'{"title":"x","content":"y"}',
+    ],
+    ids=["split-character", "not-an-object", "unknown-key", "missing-keys"],
+)
+def test_malformed_lines_are_skipped(db_file, monkeypatch, capsys, bad_line, loads):
+    # The stdlib fallback raises UnicodeDecodeError rather than JSONDecodeError.
+    monkeypatch.setattr(main, "_loads", loads)
+    db_file.write_bytes(ENTRY + bad_line + b"\n" + ENTRY)
+
+    entries = main.load_entries()
+
+    assert [entry.title for entry in entries] == ["ok", "ok"]
+    assert "Skipping unreadable line 2" in capsys.readouterr().err
+
+
+def test_save_entries_rewrites_the_file(db_file):
+    db_file.write_bytes(ENTRY + ENTRY)
+
+    main.save_entries(main.load_entries()[:1])
+
+    assert db_file.read_bytes() == ENTRY
+    assert not db_file.with_suffix(".jsonl.tmp").exists()
+
+
+def test_failed_save_keeps_journal_and_removes_temp_file(db_file, monkeypatch):
+    db_file.write_bytes(ENTRY)
+
+    def fail_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(main.os, "fsync", fail_fsync)
+
+    with pytest.raises(OSError):
+        main.save_entries([main.JournalEntry(title="new", content="c", tags="")])
+
+    assert db_file.read_bytes() == ENTRY
+    assert not db_file.with_suffix(".jsonl.tmp").exists()
+
+
+def test_populate_appends_all_seed_entries_at_once(db_file, monkeypatch, capsys):
+    calls = []
+    add_entries = main.add_entries
+
+    def record_add_entries(entries):
+        calls.append(len(entries))
+        add_entries(entries)
+
+    monkeypatch.setattr(main, "add_entries", record_add_entries)
+
+    main.populate()
+
+    assert calls == [5]
+    entries = main.load_entries()
+    assert [entry.title for entry in entries] == populate_dev_journal.TITLES
+    assert [entry.tags for entry in entries] == populate_dev_journal.TAGS
+    assert capsys.readouterr().out.count("🔥") == 5
+
+
+def test_populate_writes_nothing_when_every_record_is_rejected(
+    db_file, monkeypatch, capsys
+):
+    monkeypatch.setattr(populate_dev_journal, "TITLES", ["x" * 60] * 5)
+
+    main.populate()
+
+    assert not db_file.exists()
+    output = capsys.readouterr().out
+    assert output.count("❌") == 5
+    assert "🔥" not in output